@@ -1,19 +1,56 @@
+from __future__ import annotations
+
+from importlib import import_module
+
 import click
 
 import reactpy
-from reactpy._console.rewrite_camel_case_props import rewrite_camel_case_props
-from reactpy._console.rewrite_keys import rewrite_keys
 
+# commands are only imported once they are invoked - their short help is duplicated
+# here so that listing them (e.g. with --help) does not require importing them
+_LAZY_COMMANDS = {
+    "rewrite-keys": (
+        "reactpy._console.rewrite_keys:rewrite_keys",
+        "Rewrite files under the given paths using the new html element API.",
+    ),
+    "rewrite-camel-case-props": (
+        "reactpy._console.rewrite_camel_case_props:rewrite_camel_case_props",
+        "Rewrite camelCase props to snake_case",
+    ),
+}
+
+
+class _LazyGroup(click.Group):
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(_LAZY_COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in _LAZY_COMMANDS:
+            return None
+        module_name, attr_name = _LAZY_COMMANDS[cmd_name][0].split(":")
+        command: click.Command = getattr(import_module(module_name), attr_name)
+        return command
 
-@click.group()
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # mirrors click.MultiCommand.format_commands
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max(map(len, names))
+        rows: list[tuple[str, str]] = []
+        for name in names:
+            # a stand-in command formats the short help the same way click does
+            stand_in = click.Command(name, help=_LAZY_COMMANDS[name][1])
+            rows.append((name, stand_in.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=_LazyGroup)
 @click.version_option(reactpy.__version__, prog_name=reactpy.__name__)
 def app() -> None:
     pass
 
 
-app.add_command(rewrite_keys)
-app.add_command(rewrite_camel_case_props)
-
-
 if __name__ == "__main__":
     app()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from asyncio import Event, Task, create_task, gather
+from asyncio import Future, Task, create_task, gather, get_running_loop
 from typing import Any, Callable, Protocol, TypeVar
 
 from anyio import Semaphore
@@ -13,7 +13,7 @@ T = TypeVar("T")
 
 
 class EffectFunc(Protocol):
-    async def __call__(self, stop: Event) -> None:
+    async def __call__(self, stop: Future[None]) -> None:
         ...
 
 
@@ -81,7 +81,7 @@ class LifeCycleHook:
                 # and save state or add effects
                 current_hook().use_state(lambda: ...)
 
-                async def my_effect(stop_event):
+                async def my_effect(stop):
                     ...
 
                 current_hook().add_effect(my_effect)
@@ -134,7 +134,7 @@ class LifeCycleHook:
         self._state: tuple[Any, ...] = ()
         self._effect_funcs: list[EffectFunc] = []
         self._effect_tasks: list[Task[None]] = []
-        self._effect_stops: list[Event] = []
+        self._effect_stops: list[Future[None]] = []
         self._render_access = Semaphore(1)  # ensure only one render at a time
 
     def schedule_render(self) -> None:
@@ -169,9 +169,9 @@ class LifeCycleHook:
         """Add an effect to this hook
 
         A task to run the effect is created when the component is done rendering.
-        When the component will be unmounted, the event passed to the effect is
-        triggered and the task is awaited. The effect should eventually halt after
-        the event is triggered.
+        When the component will be unmounted, the future passed to the effect is
+        resolved and the task is awaited. The effect should eventually halt after
+        the future is resolved.
         """
         self._effect_funcs.append(effect_func)
 
@@ -210,22 +210,30 @@ class LifeCycleHook:
 
     async def affect_layout_did_render(self) -> None:
         """The layout completed a render"""
-        stop = Event()
-        self._effect_stops.append(stop)
-        self._effect_tasks.extend(create_task(e(stop)) for e in self._effect_funcs)
+        if not self._effect_funcs:
+            # no effects were added during this render
+            return None
+        loop = get_running_loop()
+        for effect in self._effect_funcs:
+            # each effect gets its own future since cancelling a task which awaits a
+            # future also cancels that future
+            stop: Future[None] = loop.create_future()
+            self._effect_stops.append(stop)
+            self._effect_tasks.append(create_task(effect(stop)))
         self._effect_funcs.clear()
 
     async def affect_component_will_unmount(self) -> None:
         """The component is about to be removed from the layout"""
         for stop in self._effect_stops:
-            stop.set()
+            if not stop.done():
+                stop.set_result(None)
         self._effect_stops.clear()
-        try:
-            await gather(*self._effect_tasks)
-        except Exception:
-            logger.exception("Error in effect")
-        finally:
-            self._effect_tasks.clear()
+        results = await gather(*self._effect_tasks, return_exceptions=True)
+        self._effect_tasks.clear()
+        for result in results:
+            # effects which were cancelled are ignored
+            if isinstance(result, Exception):
+                logger.error("Error in effect", exc_info=result)
 
     def set_current(self) -> None:
         """Set this hook as the active hook in this thread
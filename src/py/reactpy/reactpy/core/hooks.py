@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import asyncio
+from asyncio import CancelledError, Future, create_task, iscoroutinefunction
 from collections.abc import Coroutine, Sequence
 from logging import getLogger
+from operator import is_, length_hint
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
@@ -40,6 +41,9 @@ logger = getLogger(__name__)
 
 _Type = TypeVar("_Type")
 
+_EMPTY_TUPLE: tuple[Any, ...] = ()
+_UNSET: Any = object()
+
 
 @overload
 def use_state(initial_value: Callable[[], _Type]) -> State[_Type]:
@@ -64,11 +68,11 @@ def use_state(initial_value: _Type | Callable[[], _Type]) -> State[_Type]:
         A tuple containing the current state and a function to update it.
     """
     current_state = _use_const(lambda: _CurrentState(initial_value))
-    return State(current_state.value, current_state.dispatch)
+    return current_state.state
 
 
 class _CurrentState(Generic[_Type]):
-    __slots__ = "value", "dispatch"
+    __slots__ = "value", "dispatch", "commit", "state"
 
     def __init__(
         self,
@@ -80,17 +84,27 @@ class _CurrentState(Generic[_Type]):
             self.value = initial_value
 
         hook = current_hook()
+        ntb = _NUMERIC_TEXT_BINARY_TYPES
+
+        def commit(next_value: _Type) -> None:
+            # inlined version of strictly_equal
+            if next_value is self.value or (
+                type(next_value) in ntb and next_value == self.value
+            ):
+                return None
+            self.value = next_value
+            self.state = State(next_value, dispatch)
+            hook.schedule_render()
 
         def dispatch(new: _Type | Callable[[_Type], _Type]) -> None:
             if callable(new):
-                next_value = new(self.value)
+                commit(new(self.value))
             else:
-                next_value = new
-            if not strictly_equal(next_value, self.value):
-                self.value = next_value
-                hook.schedule_render()
+                commit(new)
 
         self.dispatch = dispatch
+        self.commit = commit
+        self.state = State(self.value, dispatch)
 
 
 _EffectCleanFunc: TypeAlias = "Callable[[], None]"
@@ -138,23 +152,28 @@ def use_effect(
     hook = current_hook()
 
     dependencies = _try_to_infer_closure_values(function, dependencies)
-    memoize = use_memo(dependencies=dependencies)
+    memo, changed = _use_memo(dependencies)
     last_clean_callback: Ref[_EffectCleanFunc | None] = use_ref(None)
 
     def add_effect(function: _EffectApplyFunc) -> None:
-        if not asyncio.iscoroutinefunction(function):
+        if not changed:
+            # the effect is memoized - no need to wrap or reschedule it
+            return None
+        memo.value = None
+
+        if not iscoroutinefunction(function):
             sync_function = cast(_SyncEffectFunc, function)
         else:
             async_function = cast(_AsyncEffectFunc, function)
 
             def sync_function() -> _EffectCleanFunc | None:
-                task = asyncio.create_task(async_function())
+                task = create_task(async_function())
 
                 def clean_future() -> None:
                     if not task.cancel():
                         try:
                             clean = task.result()
-                        except asyncio.CancelledError:
+                        except CancelledError:
                             pass
                         else:
                             if clean is not None:
@@ -162,16 +181,16 @@ def use_effect(
 
                 return clean_future
 
-        async def effect(stop: asyncio.Event) -> None:
+        async def effect(stop: Future[None]) -> None:
             if last_clean_callback.current is not None:
                 last_clean_callback.current()
                 last_clean_callback.current = None
             clean = last_clean_callback.current = sync_function()
-            await stop.wait()
+            await stop
             if clean is not None:
                 clean()
 
-        return memoize(lambda: hook.add_effect(effect))
+        hook.add_effect(effect)
 
     if function is not None:
         add_effect(function)
@@ -202,13 +221,20 @@ def use_debug_value(
             :func:`id` is different). By default these are inferred based on local
             variables that are referenced by the given function.
     """
-    old: Ref[Any] = _use_const(lambda: Ref(object()))
+    # always use the same amount of hook state since debug mode may be toggled
+    memo: _Memo[Any] = _use_const(_Memo)
+    if not REACTPY_DEBUG_MODE.current:
+        return None
+
     memo_func = message if callable(message) else lambda: message
-    new = use_memo(memo_func, dependencies)
+    dependencies = _try_to_infer_closure_values(memo_func, dependencies)
+    if not _update_memo_deps(memo, dependencies):
+        return None
 
-    if REACTPY_DEBUG_MODE.current and old.current != new:
-        old.current = new
+    new = memo_func()
+    if memo.value != new:
         logger.debug(f"{current_hook().component} {new}")
+    memo.value = new
 
 
 def create_context(default_value: _Type) -> Context[_Type]:
@@ -292,16 +318,20 @@ def use_reducer(
     Returns:
         A tuple containing the current state and a function to change it with an action
     """
-    state, set_state = use_state(initial_value)
-    return state, _use_const(lambda: _create_dispatcher(reducer, set_state))
+    current_state = _use_const(lambda: _CurrentState(initial_value))
+    current_reducer = use_ref(reducer)
+    current_reducer.current = reducer
+    return current_state.value, _use_const(
+        lambda: _create_dispatcher(current_reducer, current_state)
+    )
 
 
 def _create_dispatcher(
-    reducer: Callable[[_Type, _ActionType], _Type],
-    set_state: Callable[[Callable[[_Type], _Type]], None],
+    reducer: Ref[Callable[[_Type, _ActionType], _Type]],
+    state: _CurrentState[_Type],
 ) -> Callable[[_ActionType], None]:
     def dispatch(action: _ActionType) -> None:
-        set_state(lambda last_state: reducer(last_state, action))
+        state.commit(reducer.current(state.value, action))
 
     return dispatch
 
@@ -344,15 +374,20 @@ def use_callback(
         The current function
     """
     dependencies = _try_to_infer_closure_values(function, dependencies)
-    memoize = use_memo(dependencies=dependencies)
+    memo: _Memo[_CallbackFunc]
+    memo, changed = _use_memo(dependencies)
+
+    if function is not None:
+        if changed:
+            memo.value = function
+        return memo.value
 
     def setup(function: _CallbackFunc) -> _CallbackFunc:
-        return memoize(lambda: function)
+        if changed:
+            memo.value = function
+        return memo.value
 
-    if function is not None:
-        return setup(function)
-    else:
-        return setup
+    return setup
 
 
 class _LambdaCaller(Protocol):
@@ -397,46 +432,47 @@ def use_memo(
         The current state
     """
     dependencies = _try_to_infer_closure_values(function, dependencies)
+    memo: _Memo[_Type]
+    memo, changed = _use_memo(dependencies)
+
+    if function is not None:
+        if changed:
+            memo.value = function()
+        return memo.value
+
+    def setup(function: Callable[[], _Type]) -> _Type:
+        if changed:
+            memo.value = function()
+        return memo.value
+
+    return setup
+
 
-    memo: _Memo[_Type] = _use_const(_Memo)
+def _use_memo(dependencies: Sequence[Any] | None) -> tuple[_Memo[Any], bool]:
+    """Get the current memo and whether its dependencies have changed"""
+    memo: _Memo[Any] = _use_const(_Memo)
+    return memo, _update_memo_deps(memo, dependencies)
 
-    if memo.empty():
+
+def _update_memo_deps(memo: _Memo[Any], dependencies: Sequence[Any] | None) -> bool:
+    """Store the given dependencies in the memo if they have changed"""
+    if memo.value is _UNSET:
         # we need to initialize on the first run
         changed = True
-        memo.deps = () if dependencies is None else dependencies
+        memo.deps = _EMPTY_TUPLE if dependencies is None else dependencies
     elif dependencies is None:
         changed = True
-        memo.deps = ()
-    elif (
-        len(memo.deps) != len(dependencies)
-        # if deps are same length check identity for each item
-        or not all(
-            strictly_equal(current, new)
-            for current, new in zip(memo.deps, dependencies)
-        )
-    ):
+        memo.deps = _EMPTY_TUPLE
+    elif dependencies is memo.deps:
+        # e.g. both are the shared empty tuple used for functions without a closure
+        changed = False
+    elif _deps_changed(memo.deps, dependencies):
         memo.deps = dependencies
         changed = True
     else:
         changed = False
 
-    setup: Callable[[Callable[[], _Type]], _Type]
-
-    if changed:
-
-        def setup(function: Callable[[], _Type]) -> _Type:
-            current_value = memo.value = function()
-            return current_value
-
-    else:
-
-        def setup(function: Callable[[], _Type]) -> _Type:
-            return memo.value
-
-    if function is not None:
-        return setup(function)
-    else:
-        return setup
+    return changed
 
 
 class _Memo(Generic[_Type]):
@@ -447,13 +483,9 @@ class _Memo(Generic[_Type]):
     value: _Type
     deps: Sequence[Any]
 
-    def empty(self) -> bool:
-        try:
-            self.value  # noqa: B018
-        except AttributeError:
-            return True
-        else:
-            return False
+    def __init__(self) -> None:
+        self.value = _UNSET
+        self.deps = _EMPTY_TUPLE
 
 
 def use_ref(initial_value: _Type) -> Ref[_Type]:
@@ -478,17 +510,32 @@ def _try_to_infer_closure_values(
 ) -> Sequence[Any] | None:
     if values is ...:
         if isinstance(func, FunctionType):
-            return (
-                [cell.cell_contents for cell in func.__closure__]
-                if func.__closure__
-                else []
-            )
+            closure = func.__closure__
+            if not closure:
+                return _EMPTY_TUPLE
+            return [cell.cell_contents for cell in closure]
         else:
             return None
     else:
         return values
 
 
+_NUMERIC_TEXT_BINARY_TYPES = frozenset(
+    {
+        # numeric
+        int,
+        float,
+        complex,
+        # text
+        str,
+        # binary types
+        bytes,
+        bytearray,
+        memoryview,
+    }
+)
+
+
 def strictly_equal(x: Any, y: Any) -> bool:
     """Check if two values are identical or, for a limited set or types, equal.
 
@@ -505,15 +552,31 @@ def strictly_equal(x: Any, y: Any) -> bool:
     return x is y or (type(x) in _NUMERIC_TEXT_BINARY_TYPES and x == y)
 
 
-_NUMERIC_TEXT_BINARY_TYPES = {
-    # numeric
-    int,
-    float,
-    complex,
-    # text
-    str,
-    # binary types
-    bytes,
-    bytearray,
-    memoryview,
-}
+def _deps_changed(
+    old: Sequence[Any],
+    new: Sequence[Any],
+    _ntb: frozenset[type[Any]] = _NUMERIC_TEXT_BINARY_TYPES,
+) -> bool:
+    """Check whether any dependency differs according to :func:`strictly_equal`
+
+    This is called for every memoized hook on every render so :func:`strictly_equal`
+    is inlined here rather than being called once per item. It's kept in pure Python
+    (rather than a compiled extension) since ReactPy ships as a pure Python package
+    that also supports PyPy.
+    """
+    n = len(old)
+    if n != len(new):
+        return True
+    # dependencies are usually identical between renders so check that in C first
+    old_iter = iter(old)
+    if all(map(is_, old_iter, new)):
+        return False
+    # the check stopped just after the first item which was not identical - resume
+    # from there (or from the start if the iterator can't say where it stopped)
+    for i in range(max(n - length_hint(old_iter, n) - 1, 0), n):
+        x = old[i]
+        y = new[i]
+        if x is y or (type(x) in _ntb and x == y):
+            continue
+        return True
+    return False
@@ -0,0 +1,33 @@
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from reactpy.__main__ import _LAZY_COMMANDS, app
+
+
+def _get_command(name):
+    return app.get_command(click.Context(app), name)
+
+
+@pytest.mark.parametrize("name", list(_LAZY_COMMANDS))
+def test_lazy_command_short_help_matches_command(name):
+    command = _get_command(name)
+    assert command.name == name
+    assert _LAZY_COMMANDS[name][1] == command.get_short_help_str(limit=sys.maxsize)
+
+
+def test_lazy_command_help_is_formatted_like_click():
+    eager_app = click.Group(
+        name=app.name,
+        params=app.params,
+        commands=[_get_command(name) for name in _LAZY_COMMANDS],
+    )
+
+    runner = CliRunner()
+    lazy_result = runner.invoke(app, ["--help"], terminal_width=80)
+    eager_result = runner.invoke(eager_app, ["--help"], terminal_width=80)
+
+    assert lazy_result.exit_code == 0
+    assert lazy_result.output == eager_result.output
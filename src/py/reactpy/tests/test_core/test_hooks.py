@@ -6,7 +6,7 @@ import reactpy
 from reactpy import html
 from reactpy.config import REACTPY_DEBUG_MODE
 from reactpy.core._life_cycle_hook import LifeCycleHook
-from reactpy.core.hooks import strictly_equal, use_effect
+from reactpy.core.hooks import _deps_changed, strictly_equal, use_effect
 from reactpy.core.layout import Layout
 from reactpy.testing import DisplayFixture, HookCatcher, assert_reactpy_did_log, poll
 from reactpy.testing.logs import assert_reactpy_did_not_log
@@ -476,6 +476,27 @@ async def test_memoized_effect_cleanup_only_triggered_before_new_effect():
         assert cleanup_trigger_count.current == 1
 
 
+async def test_memoized_effect_does_not_accumulate_stop_signals():
+    component_hook = HookCatcher()
+
+    @reactpy.component
+    @component_hook.capture
+    def ComponentWithMemoizedEffect():
+        @reactpy.hooks.use_effect(dependencies=[])
+        def effect():
+            pass
+
+        return reactpy.html.div()
+
+    async with reactpy.Layout(ComponentWithMemoizedEffect()) as layout:
+        await layout.render()
+        for _ in range(3):
+            component_hook.latest.schedule_render()
+            await layout.render()
+
+        assert len(component_hook.latest._effect_stops) == 1
+
+
 async def test_use_async_effect():
     effect_ran = asyncio.Event()
 
@@ -600,6 +621,50 @@ async def test_error_in_effect_pre_unmount_cleanup_is_gracefully_handled():
             await layout.render()  # no error
 
 
+async def test_cancelling_one_effect_does_not_stop_its_siblings():
+    component_hook = HookCatcher()
+    cleaned_up = []
+
+    @reactpy.component
+    def Parent():
+        return reactpy.html.div(ComponentWithEffects(), OtherComponentWithEffect())
+
+    @reactpy.component
+    @component_hook.capture
+    def ComponentWithEffects():
+        @reactpy.hooks.use_effect(dependencies=[])
+        def first_effect():
+            return lambda: cleaned_up.append("first")
+
+        @reactpy.hooks.use_effect(dependencies=[])
+        def second_effect():
+            return lambda: cleaned_up.append("second")
+
+        return reactpy.html.div()
+
+    @reactpy.component
+    def OtherComponentWithEffect():
+        @reactpy.hooks.use_effect(dependencies=[])
+        def other_effect():
+            return lambda: cleaned_up.append("other")
+
+        return reactpy.html.div()
+
+    async with reactpy.Layout(Parent()) as layout:
+        await layout.render()
+        await asyncio.sleep(0)  # let the effects start
+
+        first_task, second_task = component_hook.latest._effect_tasks
+        first_task.cancel()
+        await asyncio.sleep(0)
+
+        assert first_task.cancelled()
+        assert not second_task.done()
+
+    # the cancelled effect's cleanup never runs but unmounting is not interrupted
+    assert sorted(cleaned_up) == ["other", "second"]
+
+
 async def test_use_reducer():
     saved_count = reactpy.Ref(None)
     saved_dispatch = reactpy.Ref(None)
@@ -661,6 +726,42 @@ async def test_use_reducer_dispatch_callback_identity_is_preserved():
         assert first_dispatch is d
 
 
+async def test_use_reducer_dispatch_uses_latest_reducer():
+    component_hook = HookCatcher()
+    saved_count = reactpy.Ref(None)
+    saved_dispatch = reactpy.Ref(None)
+    step_size = reactpy.Ref(1)
+
+    @reactpy.component
+    @component_hook.capture
+    def Counter():
+        step = step_size.current
+
+        def reducer(count, action):
+            return count + step
+
+        saved_count.current, saved_dispatch.current = reactpy.hooks.use_reducer(
+            reducer, 0
+        )
+        return reactpy.html.div()
+
+    async with reactpy.Layout(Counter()) as layout:
+        await layout.render()
+
+        saved_dispatch.current("increment")
+        await layout.render()
+        assert saved_count.current == 1
+
+        step_size.current = 10
+        component_hook.latest.schedule_render()
+        await layout.render()
+
+        # the reducer from the latest render should be used
+        saved_dispatch.current("increment")
+        await layout.render()
+        assert saved_count.current == 11
+
+
 async def test_use_callback_identity():
     component_hook = HookCatcher()
     used_callbacks = []
@@ -741,6 +842,35 @@ async def test_use_memo():
     assert len(used_values) == 3
 
 
+async def test_use_memo_as_decorator_with_dependencies():
+    component_hook = HookCatcher()
+    set_state_hook = reactpy.Ref(None)
+    used_values = []
+
+    @reactpy.component
+    @component_hook.capture
+    def ComponentWithMemo():
+        state, set_state_hook.current = reactpy.hooks.use_state(0)
+
+        @reactpy.hooks.use_memo(dependencies=[state])
+        def value():
+            return reactpy.Ref(state)  # use a Ref here just to ensure it's a unique obj
+
+        used_values.append(value)
+        return reactpy.html.div()
+
+    async with reactpy.Layout(ComponentWithMemo()) as layout:
+        await layout.render()
+        set_state_hook.current(1)
+        await layout.render()
+        component_hook.latest.schedule_render()
+        await layout.render()
+
+    assert used_values[0] is not used_values[1]
+    assert used_values[1] is used_values[2]
+    assert [v.current for v in used_values] == [0, 1, 1]
+
+
 async def test_use_memo_always_runs_if_dependencies_are_none():
     component_hook = HookCatcher()
     used_values = []
@@ -1118,6 +1248,53 @@ async def test_use_debug_mode_does_not_log_if_not_in_debug_mode():
             await layout.render()
 
 
+async def test_use_debug_value_does_nothing_if_debug_mode_is_off():
+    original_debug_mode = REACTPY_DEBUG_MODE.current
+    REACTPY_DEBUG_MODE.current = False
+    try:
+        message_constructor_calls = []
+
+        @reactpy.component
+        def SomeComponent():
+            reactpy.use_debug_value(lambda: message_constructor_calls.append(None))
+            return reactpy.html.div()
+
+        async with reactpy.Layout(SomeComponent()) as layout:
+            await layout.render()
+
+        assert not message_constructor_calls
+    finally:
+        REACTPY_DEBUG_MODE.current = original_debug_mode
+
+
+async def test_toggling_debug_mode_does_not_break_use_debug_value():
+    original_debug_mode = REACTPY_DEBUG_MODE.current
+    try:
+        component_hook = HookCatcher()
+        state = reactpy.Ref()
+
+        @reactpy.component
+        @component_hook.capture
+        def SomeComponent():
+            reactpy.use_debug_value("message")
+            state.current, set_state = reactpy.use_state(0)
+            reactpy.use_effect(lambda: set_state(1), [])
+            return reactpy.html.div()
+
+        async with reactpy.Layout(SomeComponent()) as layout:
+            REACTPY_DEBUG_MODE.current = False
+            await layout.render()
+            assert state.current == 0
+
+            for debug_mode in [True, False, True]:
+                REACTPY_DEBUG_MODE.current = debug_mode
+                component_hook.latest.schedule_render()
+                await layout.render()
+                assert state.current == 1
+    finally:
+        REACTPY_DEBUG_MODE.current = original_debug_mode
+
+
 async def test_conditionally_rendered_components_can_use_context():
     set_state = reactpy.Ref()
     used_context_values = []
@@ -1172,6 +1349,26 @@ def test_strictly_equal(x, y, result):
     assert strictly_equal(x, y) is result
 
 
+_A, _B, _C = object(), object(), object()
+
+
+@pytest.mark.parametrize(
+    "old, new, result",
+    [
+        ([_A, _B], [_A, _B], False),
+        ([_A, _B], (_A, _B), False),
+        ([_A, _B], [_A], True),
+        ([_A, _B], [_C, _B], True),
+        ([_A, _B], [_A, _C], True),
+        # equal values (but not identical) after an identical item
+        ([_A, 1.0, "text"], [_A, float("1.0"), "".join("text")], False),
+        ([_A, 1.0, _B], [_A, float("1.0"), _C], True),
+    ],
+)
+def test_deps_changed(old, new, result):
+    assert _deps_changed(old, new) is result
+
+
 STRICT_EQUALITY_VALUE_CONSTRUCTORS = [
     lambda: "string-text",
     lambda: b"byte-text",